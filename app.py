@@ -1,6 +1,10 @@
+import json
+import os
+
 import streamlit as st
-import pandas as pd
-import yfinance as yf
+import numpy as np
+
+from market_data import ETF_LIST, get_prices
 
 # =====================================================
 # CONFIG
@@ -20,20 +24,69 @@ p, div {font-size: 0.9rem !important;}
 </style>
 """, unsafe_allow_html=True)
 
-ETF_LIST = ["QDTE", "CHPY", "XDTE"]
+WEEKS_PER_YEAR = 52
+WEEKS_PER_MONTH = WEEKS_PER_YEAR / 12
+
+# =====================================================
+# FORMATTING
+# =====================================================
+def col(v): return "green" if v >= 0 else "red"
+
+def position_card(price, div, weekly, monthly, annual, value):
+    price_txt = f"${price:.2f}" if price else "—"
+    return f"""
+        <div class="card">
+        <b>Price:</b> {price_txt}<br>
+        <b>Dividend / share:</b> ${div:.4f}<br>
+        <b>Weekly income:</b> <span class="{col(weekly)}">${weekly:.2f}</span><br>
+        <b>Monthly income:</b> <span class="{col(monthly)}">${monthly:.2f}</span><br>
+        <b>Annual income:</b> <span class="{col(annual)}">${annual:.2f}</span><br>
+        <b>Position value:</b> <span class="{col(value)}">${value:,.2f}</span>
+        </div>
+        """
 
 # =====================================================
 # SESSION STATE
 # =====================================================
+# (ticker, shares, weekly dividend / share) — immutable, copied per session
+DEFAULT_HOLDINGS = (
+    ("QDTE", 125, 0.177),
+    ("CHPY", 63,  0.52),
+    ("XDTE", 84,  0.16),
+)
+
+# last submitted portfolio, so a browser refresh doesn't reset to defaults
+STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".state", "portfolio.json")
+
+def load_portfolio():
+    try:
+        with open(STATE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_portfolio(holdings, cash):
+    try:
+        os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+        with open(STATE_PATH + ".tmp", "w") as f:
+            json.dump({"holdings": holdings, "cash": cash}, f)
+        os.replace(STATE_PATH + ".tmp", STATE_PATH)
+    except OSError:
+        pass
+
+if "holdings" not in st.session_state or "cash" not in st.session_state:
+    saved = load_portfolio()
+
 if "holdings" not in st.session_state:
     st.session_state.holdings = {
-        "QDTE": {"shares": 125, "div": 0.177},
-        "CHPY": {"shares": 63,  "div": 0.52},
-        "XDTE": {"shares": 84,  "div": 0.16},
+        t: {"shares": shares, "div": div} for t, shares, div in DEFAULT_HOLDINGS
     }
+    for t, h in saved.get("holdings", {}).items():
+        if t in st.session_state.holdings:
+            st.session_state.holdings[t].update(h)
 
 if "cash" not in st.session_state:
-    st.session_state.cash = 0.0
+    st.session_state.cash = float(saved.get("cash", 0.0))
 
 if "PORTFOLIO_LOCKED" not in st.session_state:
     st.session_state.PORTFOLIO_LOCKED = False
@@ -41,14 +94,13 @@ if "PORTFOLIO_LOCKED" not in st.session_state:
 # =====================================================
 # DATA
 # =====================================================
-@st.cache_data(ttl=600)
-def get_price(t):
-    try:
-        return round(yf.Ticker(t).history(period="5d")["Close"].iloc[-1], 2)
-    except:
-        return 0.0
-
-prices = {t: get_price(t) for t in ETF_LIST}
+# zero-share positions add nothing to value — skip their price lookups
+# (read the widget state so a just-submitted share count is honoured)
+held = tuple(
+    t for t in ETF_LIST
+    if st.session_state.get(f"s_{t}", st.session_state.holdings[t]["shares"]) > 0
+)
+prices = get_prices(held)
 
 # =====================================================
 # PORTFOLIO TAB (ONLY ACTIVE LOGIC)
@@ -57,82 +109,81 @@ st.title("📁 Portfolio — Locked Foundation")
 
 validation_errors = []
 
-total_weekly = 0
-total_value = 0
-
 # =====================================================
 # HOLDINGS
 # =====================================================
-for t in ETF_LIST:
-    st.subheader(t)
-    c1, c2, c3 = st.columns(3)
-
-    with c1:
-        st.session_state.holdings[t]["shares"] = st.number_input(
-            "Shares",
-            min_value=0,
-            step=1,
-            value=int(st.session_state.holdings[t]["shares"]),
-            key=f"s_{t}"
-        )
-
-    with c2:
-        st.session_state.holdings[t]["div"] = st.number_input(
-            "Weekly Dividend / Share ($)",
-            min_value=0.0,
-            step=0.01,
-            format="%.4f",
-            value=float(st.session_state.holdings[t]["div"]),
-            key=f"d_{t}"
-        )
-
-    shares = st.session_state.holdings[t]["shares"]
-    div = st.session_state.holdings[t]["div"]
-    price = prices[t]
-
-    # ---- VALIDATION ----
-    if shares < 0:
-        validation_errors.append(f"{t}: shares invalid")
-    if div < 0:
-        validation_errors.append(f"{t}: dividend invalid")
-
-    weekly = shares * div
-    monthly = weekly * 52 / 12
-    annual = weekly * 52
-    value = shares * price
-
-    total_weekly += weekly
-    total_value += value
-
-    def col(v): return "green" if v >= 0 else "red"
-
-    with c3:
-        st.markdown(f"""
-        <div class="card">
-        <b>Price:</b> ${price:.2f}<br>
-        <b>Dividend / share:</b> ${div:.4f}<br>
-        <b>Weekly income:</b> <span class="{col(weekly)}">${weekly:.2f}</span><br>
-        <b>Monthly income:</b> <span class="{col(monthly)}">${monthly:.2f}</span><br>
-        <b>Annual income:</b> <span class="{col(annual)}">${annual:.2f}</span><br>
-        <b>Position value:</b> <span class="{col(value)}">${value:,.2f}</span>
-        </div>
-        """, unsafe_allow_html=True)
-
-st.divider()
-
-# =====================================================
-# CASH
-# =====================================================
-st.subheader("💰 Cash Wallet")
-st.session_state.cash = st.number_input(
-    "Cash ($)",
-    min_value=0.0,
-    step=50.0,
-    value=float(st.session_state.cash)
-)
-
-total_value += st.session_state.cash
-monthly_income = total_weekly * 52 / 12
+holdings = st.session_state.holdings
+
+# inputs only trigger a rerun (and price/total recompute) on submit
+with st.form("portfolio_inputs"):
+    for t in ETF_LIST:
+        h = holdings[t]
+        st.subheader(t)
+        c1, c2, c3 = st.columns(3)
+
+        with c1:
+            h["shares"] = st.number_input(
+                "Shares",
+                min_value=0,
+                step=1,
+                value=int(h["shares"]),
+                key=f"s_{t}"
+            )
+
+        with c2:
+            h["div"] = st.number_input(
+                "Weekly Dividend / Share ($)",
+                min_value=0.0,
+                step=0.01,
+                format="%.4f",
+                value=float(h["div"]),
+                key=f"d_{t}"
+            )
+
+        shares = h["shares"]
+        div = h["div"]
+        price = prices.get(t, 0.0)
+
+        # ---- VALIDATION ----
+        if shares < 0:
+            validation_errors.append(f"{t}: shares invalid")
+        if div < 0:
+            validation_errors.append(f"{t}: dividend invalid")
+
+        weekly = shares * div
+        monthly = weekly * WEEKS_PER_MONTH
+        annual = weekly * WEEKS_PER_YEAR
+        value = shares * price
+
+        with c3:
+            st.markdown(
+                position_card(price, div, weekly, monthly, annual, value),
+                unsafe_allow_html=True
+            )
+
+    st.divider()
+
+    # =================================================
+    # CASH
+    # =================================================
+    st.subheader("💰 Cash Wallet")
+    st.session_state.cash = st.number_input(
+        "Cash ($)",
+        min_value=0.0,
+        step=50.0,
+        value=float(st.session_state.cash)
+    )
+
+    submitted = st.form_submit_button("Update portfolio")
+
+# ---- TOTALS (one vectorized pass over all holdings) ----
+shares_arr = np.array([holdings[t]["shares"] for t in ETF_LIST], dtype=float)
+div_arr = np.array([holdings[t]["div"] for t in ETF_LIST], dtype=float)
+price_arr = np.array([prices.get(t, 0.0) for t in ETF_LIST], dtype=float)
+
+total_weekly = float(shares_arr @ div_arr)
+total_value = float(shares_arr @ price_arr) + st.session_state.cash
+monthly_income = total_weekly * WEEKS_PER_MONTH
 annual_income = monthly_income * 12
 
 # =====================================================
@@ -160,6 +211,9 @@ if validation_errors:
         st.error(e)
 else:
     st.session_state.PORTFOLIO_LOCKED = True
+    # the form submit already debounces edits — one write per update
+    if submitted:
+        save_portfolio(holdings, st.session_state.cash)
     st.markdown("<div class='lock'>🟢 Portfolio LOCKED — safe to build on</div>", unsafe_allow_html=True)
 
 # =====================================================
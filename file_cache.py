@@ -0,0 +1,40 @@
+# file_cache.py
+# =====================================================
+# FILE CACHE — JSON entries on disk, survive restarts
+# =====================================================
+
+import hashlib
+import json
+import os
+import time
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+class FileCache:
+    def __init__(self, ttl_seconds=900, cache_dir=CACHE_DIR):
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+
+    def _path(self, key):
+        name = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("ts", 0) > self.ttl_seconds:
+            return None
+        return entry.get("value")
+
+    def set(self, key, value):
+        path = self._path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path + ".tmp", "w") as f:
+                json.dump({"ts": time.time(), "value": value}, f)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
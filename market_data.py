@@ -0,0 +1,109 @@
+# market_data.py
+# =====================================================
+# MARKET DATA — shared by app.py and portfolio_locked.py
+# yfinance is imported on first fetch, not at startup
+# =====================================================
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import streamlit as st
+
+from file_cache import FileCache
+
+ETF_LIST = ["QDTE", "CHPY", "XDTE"]
+
+RATE_LIMIT_COOLDOWN = 900  # seconds to stay off Yahoo after a 429
+
+_TICKER_RE = re.compile(r"^[A-Z]{1,5}$")
+
+_price_cache = FileCache(ttl_seconds=600)
+_ticker_cache = {}
+_rate_limited_until = 0.0
+
+def _fetch_errors():
+    # failures that mean "no price right now" — anything else is a bug and should raise
+    # (requests / curl_cffi network errors are OSError subclasses)
+    from yfinance import exceptions as yf_exc
+    return (KeyError, IndexError, ValueError, OSError,
+            getattr(yf_exc, "YFException", OSError))
+
+def _note_rate_limit(e):
+    global _rate_limited_until
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    if type(e).__name__ == "YFRateLimitError" or status == 429:
+        _rate_limited_until = time.time() + RATE_LIMIT_COOLDOWN
+
+def _rate_limited():
+    return time.time() < _rate_limited_until
+
+def yf_ticker(sym):
+    # reuse Ticker objects (and their internal state) across reruns
+    tk = _ticker_cache.get(sym)
+    if tk is None:
+        import yfinance as yf
+        tk = _ticker_cache[sym] = yf.Ticker(sym)
+    return tk
+
+def _last_close(close):
+    # last finite, positive close straight off the numpy buffer; None if there is none
+    a = close.to_numpy(dtype=float)
+    a = a[np.isfinite(a)]
+    return round(float(a[-1]), 2) if a.size and a[-1] > 0 else None
+
+def _fetch_price(t):
+    if _rate_limited():
+        return 0.0
+    try:
+        return _last_close(yf_ticker(t).history(period="5d")["Close"]) or 0.0
+    except _fetch_errors() as e:
+        _note_rate_limit(e)
+        return 0.0
+
+def get_prices(tickers):
+    # dedupe and sanity-check symbols before they reach the cache key or Yahoo
+    valid = tuple(sorted({t for t in tickers if _TICKER_RE.match(t)}))
+    prices = _get_prices(valid) if valid else {}
+    return {t: prices.get(t, 0.0) for t in tickers}
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _get_prices(tickers):
+    key = "prices:5d:" + ",".join(tickers)
+    cached = _price_cache.get(key)
+    if cached is not None:
+        return cached
+    if _rate_limited():
+        return {t: 0.0 for t in tickers}
+
+    import yfinance as yf
+
+    # one batched request for every ticker instead of one per ETF
+    prices = {}
+    try:
+        # only Close is used — drop Open/High/Low/Volume straight away
+        closes = yf.download(
+            list(tickers),
+            period="5d",
+            threads=True,
+            progress=False
+        )["Close"]
+        for t in tickers:
+            if t in closes:
+                price = _last_close(closes[t])
+                if price is not None:
+                    prices[t] = price
+    except _fetch_errors() as e:
+        _note_rate_limit(e)
+
+    # tickers the batch could not serve are fetched one by one, concurrently
+    missing = [t for t in tickers if t not in prices]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as ex:
+            prices.update(zip(missing, ex.map(_fetch_price, missing)))
+
+    # failed lookups come back as 0.0 — never persist those
+    if all(prices[t] > 0 for t in tickers):
+        _price_cache.set(key, prices)
+    return prices
@@ -6,25 +6,15 @@
 
 PORTFOLIO_VERSION = "1.0-LOCKED"
 
+import numpy as np
 import streamlit as st
-import yfinance as yf
 
-ETF_LIST = ["QDTE", "CHPY", "XDTE"]
+from market_data import ETF_LIST, get_prices
 
 def render_portfolio():
     st.title("📁 Portfolio — Locked Foundation")
 
-    total_weekly = 0
-    total_value = 0
-
-    @st.cache_data(ttl=600)
-    def get_price(t):
-        try:
-            return round(yf.Ticker(t).history(period="5d")["Close"].iloc[-1], 2)
-        except:
-            return 0.0
-
-    prices = {t: get_price(t) for t in ETF_LIST}
+    prices = get_prices(tuple(ETF_LIST))
 
     for t in ETF_LIST:
         st.subheader(t)
@@ -55,9 +45,6 @@ def render_portfolio():
         annual = weekly * 52
         value = shares * price
 
-        total_weekly += weekly
-        total_value += value
-
         with c3:
             st.markdown(f"""
             **Price:** ${price:.2f}  
@@ -68,5 +55,9 @@ def render_portfolio():
             **Position value:** ${value:,.2f}
             """)
 
+    shares_arr = np.array([st.session_state.holdings[t]["shares"] for t in ETF_LIST], dtype=float)
+    price_arr = np.array([prices[t] for t in ETF_LIST], dtype=float)
+    total_value = float(shares_arr @ price_arr)
+
     st.divider()
     st.metric("💼 Total Portfolio Value", f"${total_value:,.2f}")
\ No newline at end of file